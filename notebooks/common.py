@@ -4,11 +4,17 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib import ticker
 import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+from matplotlib.collections import PathCollection
+from matplotlib.markers import MarkerStyle
+from matplotlib.transforms import IdentityTransform
 
 import pathlib
 import requests
 import bs4
 import re
+import functools
+import hashlib
 import statsmodels.api as sm
 import os
 from time import time
@@ -16,7 +22,15 @@ import datetime
 import scipy.stats as stats
 from io import StringIO
 
-from typing import List
+from typing import Iterable, List, Optional
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional - see calculate_ewm()
+    _HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        return lambda function: function
 
 
 # --- WARNINGS ---
@@ -35,33 +49,75 @@ def print_warnings():
 
 def check_file_current(filename, message):
     file_status = os.stat(filename)
-    modified_date = datetime.date(*time.localtime(file_status.st_mtime)[:3])
+    modified_date = datetime.date.fromtimestamp(file_status.st_mtime)
     today = datetime.date.today()
     if modified_date != today:
         warn(f'{filename}: File looks old. ' + message)
 
+
+def check_files_current(filenames, message):
+    """Check that each of a number of files was modified today."""
+    for filename in filenames:
+        check_file_current(filename, message)
+
 # --- WEB SCRAPING -=-
 
 # --- [VERY SIMPLE] WEB BASED DATA CAPTURE --
 
-def get_url(url: str) -> str:
-    """Get the text at a URL."""
+CACHE_DIR = '../cache/'
+CACHE_HOURS = 6
+
+
+def _cache_file(url: str) -> pathlib.Path:
+    """The file where get_url() keeps its copy of a URL."""
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return pathlib.Path(CACHE_DIR) / f'{key}.html'
+
+
+def get_url(url: str, cache_hours: float = CACHE_HOURS) -> str:
+    """Get the text at a URL. A copy is kept on disk, and reused
+    for subsequent calls within cache_hours of the download."""
     
+    cache_file = _cache_file(url)
+    if (
+        cache_file.exists()
+        and time() - cache_file.stat().st_mtime < cache_hours * 60 * 60
+    ):
+        return cache_file.read_text(encoding='utf-8')
+
     headers = {
         "Cache-Control": "no-cache, must-revalidate, private, max-age=0",
         "Pragma": "no-cache",
     }
     response = requests.get(url.format(rn=time()), headers=headers)
     assert response.status_code == 200  # successful retrieval
+    pathlib.Path(CACHE_DIR).mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(response.text, encoding='utf-8')
     return response.text
 
 
-def get_table_list(url: str) -> List[pd.DataFrame]:
-    """Get a list of pandas DataFrames at a URL."""
+@functools.lru_cache(maxsize=64)
+def _read_tables(url: str, modified: int) -> List[pd.DataFrame]:
+    """Parse the tables in the cached copy of a URL, remembering the
+    result for as long as that copy (last modified at modified) is used."""
+    
+    html = _cache_file(url).read_text(encoding='utf-8')
+    return pd.read_html(StringIO(html))
+
+
+def get_table_list(
+    url: str, which: Optional[Iterable[int]] = None
+) -> List[pd.DataFrame]:
+    """Get a list of pandas DataFrames at a URL.
+    If which is given, only the tables at those positions are returned."""
     
-    html = get_url(url)
-    df_list = pd.read_html(StringIO(html))
-    return df_list
+    get_url(url)  # refresh the copy on disk, if it is out of date
+    modified = _cache_file(url).stat().st_mtime_ns
+    tables = _read_tables(url, modified)
+    if which is not None:
+        tables = [tables[i] for i in which]
+    # copies, so the remembered tables cannot be changed by callers
+    return [df.copy() for df in tables]
 
 
 # --- DATA CLEANING ---
@@ -74,13 +130,23 @@ minus  = '\u2212'
 tilde =  '~'
 comma =  ','
 
+# Wikipedia footnote references, eg. "Newspoll[12]"
+_FOOTNOTE_RE = re.compile(r'\[.*\]$')
+
+# Footnotes, then the symbols and placeholders that may appear in
+# numerical cells - all removed in a single pass over the strings
+_NUM_CLEAN_RE = re.compile(
+    _FOOTNOTE_RE.pattern
+    + '|[' + re.escape(f'%{tilde}{hyphen}{endash}{emdash}{minus}?<') + ']'
+    + r'|n/a'
+)
+
 
 def remove_event_rows(t: pd.DataFrame) -> pd.DataFrame:
     """Remove the event marker rows."""
-    t = t.loc[t[t.columns[0]] != t[t.columns[1]]]
-    t = t.loc[t[t.columns[1]] != t[t.columns[2]]]
-    t = t[t[t.columns[1]].notna()]
-    return t
+    c0, c1, c2 = (t.iloc[:, i].to_numpy() for i in range(3))
+    keep = (c0 != c1) & (c1 != c2) & pd.notna(c1)
+    return t[keep]
 
 
 def drop_empty(t: pd.DataFrame) -> pd.DataFrame:
@@ -90,41 +156,41 @@ def drop_empty(t: pd.DataFrame) -> pd.DataFrame:
     return t
 
 
+# Top level names of the columns that fix_numerical_cols() converts
+_FIXABLE_COLS = frozenset((
+    # For the 2022 cycle
+    'Primary vote', '2pp vote',
+    'Preferred Prime Minister',
+    'Morrison', 'Albanese',
+    'Sample size', 
+    # For historical cycles
+    'TPP vote', '2PP vote', 
+    'Political parties',
+    'Two-party-preferred',
+))
+
+
 def fix_numerical_cols(t: pd.DataFrame) -> pd.DataFrame:
     """Convert selected columns from strings to numeric data type."""
     
-    # some constants
-    fixable_cols = (
-        # For the 2022 cycle
-        'Primary vote', '2pp vote',
-        'Preferred Prime Minister',
-        'Morrison', 'Albanese',
-        'Sample size', 
-        # For historical cycles
-        'TPP vote', '2PP vote', 
-        'Political parties',
-        'Two-party-preferred',
-    )
-
     # navigate fixable columns and convert to numerical dtype
-    for c in t.columns[t.columns.get_level_values(0).isin(fixable_cols)]:
-        if str(t[c].dtype) in ['object', ]:
-            t[c] = (
+    cleaned = {}
+    fixable = [c for c in t.columns if c[0] in _FIXABLE_COLS]
+    for c in fixable:
+        if t[c].dtype == object:
+            cleaned[c] = (
                 t[c]
-                .str.replace('\[.*\]$', '', regex=True) # remove footnotes
-                .str.replace('%', '')    # remove percent symbol
-                .str.replace(tilde, '')  # replace tilde with nothing
-                .str.replace(hyphen, '') # replace hyphen with nothing
-                .str.replace(endash, '') # replace hyphen with nothing
-                .str.replace(emdash, '') # replace hyphen with nothing
-                .str.replace(minus, '')  # replace hyphen with nothing
-                .str.replace('n/a', '')  # replace 'n/a' with nothing
-                .str.replace('?', '', regex=False)  # replace '?' with nothing
-                .str.replace('<', '', regex=False)  # replace '<' with nothing
+                .str.replace(_NUM_CLEAN_RE, '', regex=True) # footnotes and symbols
                 .str.strip()             # strip white space
                 .replace('', np.nan)     # NaN empty lines
                 .astype(float)           # float
             )
+
+    # replace the columns in a shallow copy, leaving the input untouched
+    if cleaned:
+        t = t.copy(deep=False)
+        for c, series in cleaned.items():
+            t[c] = series
     return t
 
 
@@ -150,94 +216,92 @@ def remove_footnotes(t: pd.DataFrame) -> pd.DataFrame:
             continue
         col = t.columns[t.columns.get_level_values(0) == brand]
         assert(len(col) == 1)
-        t.loc[:, col] = (
-            t.loc[:, col] # returns a single column DataFrame
-            .pipe(lambda x: x[x.columns[0]]) # make as Series
-            .str.replace('\[.*\]$', '', regex=True) # remove footnotes
-            .str.strip() # remove any leading/trailing whitespaces
-        )
+        # a plain loop beats the .str accessor on these short strings,
+        # and most brand names have no footnote to remove
+        t[col[0]] = [
+            (_FOOTNOTE_RE.sub('', v) if '[' in v else v).strip()
+            if isinstance(v, str) else v
+            for v in t[col[0]].to_numpy()
+        ]
     return t
 
 
-def get_mean_date(tokens: List[str]) -> pd.Timestamp:
-    """Extract the middle date from a list of date tokens."""
-
-    last_day = None
-    day, month, year = None, None, None
-    remember = tokens.copy()
-    while tokens:
-        token = tokens.pop()
-
-        if re.match(r"[0-9]{4}", token):
-            year = token
-        elif re.match(r"[A-Za-z]+", token):
-            month = token
-        elif re.match(r"[0-9]{1,2}", token):
-            day = token
-        else:
-            print(
-                f"WARNING: {token} not recognised in get_mean_date()"
-                f"with these date tokens {remember}"
-            )
-
-        if (
-            last_day is None
-            and day is not None
-            and month is not None
-            and year is not None
-        ):
-            last_day = pd.Timestamp(f"{year} {month[:3]} {day}")
-
-    if month is None:
-        print(f"WARNING: missing month in these tokens? {remember}")
-
-    # sadly we have cases of this ...
-    if not last_day:
-        if day is None:
-            day = 1  # assume first of month
-        last_day = pd.Timestamp(f"{year} {month[:3]} {day}")
-
-    # get the middle date
-    first_day = pd.Timestamp(f"{year} {month[:3]} {day}")
-    if first_day > last_day:
-        print(
-            f"CHECK these dates in get_mean_date(): {first_day} "
-            f"{last_day} with these tokens {remember}"
-        )
-
-    return (first_day + ((last_day - first_day) / 2)).date()
+# Footnotes in date cells, and runs of the characters that separate
+# date tokens (including the various dashes used in date ranges)
+_DATE_FOOTNOTE_RE = re.compile(r"\[.+\]")
+_DATE_SEPARATOR_RE = re.compile(
+    "[" + re.escape(f"{hyphen}{endash}{emdash}{minus},/") + r"\s]+"
+)
 
 
-def tokenise_dates(dates: pd.Series) -> pd.Series:
-    """Return the date as a list of tokens."""
+def normalise_dates(dates: pd.Series) -> pd.Series:
+    """Return the dates as strings, with footnotes removed and
+    single space separators between the date tokens."""
     if type(dates) is pd.DataFrame:
         dates = dates[dates.columns[0]]  # WTF?
 
     return (
         dates.str.strip()
-        .str.replace("\[.+\]", "", regex=True)  # footnotes
-        .str.replace(endash, hyphen)
-        .str.replace(emdash, hyphen)
-        .str.replace(minus, hyphen)
+        .str.replace(_DATE_FOOTNOTE_RE, "", regex=True)
         .str.replace("c. ", "", regex=False)
-        .str.split(r"[\-,\s\/]+")
+        .str.replace(_DATE_SEPARATOR_RE, " ", regex=True)
+        .str.strip()
     )
 
 
+# Normalised date ranges look like "12 15 Jan 2023", "30 Jan 3 Feb 2023",
+# "28 Dec 2022 3 Jan 2023", "12 January 2023" or "Jan 2023"
+_DATE_RANGE_RE = re.compile(
+    r"^(?:(?P<d1>[0-9]{1,2}) )?(?:(?P<m1>[A-Za-z]+) )?(?:(?P<y1>[0-9]{4}) )?"
+    r"(?:(?P<d2>[0-9]{1,2}) )?(?P<m2>[A-Za-z]+) (?P<y2>[0-9]{4})$"
+)
+
+
 def middle_date(t: pd.DataFrame) -> pd.DataFrame:
     """Get the middle date in the date range, into column 'Mean Date'."""
 
     # assumes dates in strings are ordered from first to last
-    tokens = tokenise_dates(t["Date(s)"])
-    t["Mean Date"] = tokens.apply(get_mean_date).astype("datetime64[ns]")
+    dates = normalise_dates(t["Date(s)"])
+    # string dtype, so the fillna() and string operations below still
+    # work (and flag the problem) when a part is missing from every row
+    parts = dates.str.extract(_DATE_RANGE_RE).astype("string")
+
+    # the first date borrows whatever it lacks from the last date,
+    # and we assume the first of the month when no day is given
+    last_d = parts["d2"].fillna(parts["d1"]).fillna("1")
+    first_d = parts["d1"].fillna(last_d)
+    first_m = parts["m1"].fillna(parts["m2"])
+    first_y = parts["y1"].fillna(parts["y2"])
+
+    def to_date(d, m, y):
+        return pd.to_datetime(
+            d.str.cat([m.str[:3], y], sep=" "),  # NaN if anything is missing
+            format="%d %b %Y", errors="coerce",
+        )
+
+    first_day = to_date(first_d, first_m, first_y)
+    last_day = to_date(last_d, parts["m2"], parts["y2"])
+
+    for date in dates[first_day.isna() | last_day.isna()]:
+        print(f"WARNING: {date} not recognised in middle_date()")
+    for date in dates[first_day > last_day]:
+        print(f"CHECK these dates in middle_date(): {date}")
+
+    # get the middle date, using whole days since the epoch
+    first = first_day.to_numpy(dtype="datetime64[D]").view(np.int64)
+    last = last_day.to_numpy(dtype="datetime64[D]").view(np.int64)
+    mean = ((first + last) // 2).view("datetime64[D]")
+    mean[(first_day.isna() | last_day.isna()).to_numpy()] = np.datetime64("NaT")
+    t["Mean Date"] = mean.astype("datetime64[ns]")
     return t
     
 
 def clean(table: pd.DataFrame) -> pd.DataFrame:
     """Clean the extracted data tables."""
     
-    t = table.copy()
-    t = remove_event_rows(t)
+    # no up-front copy - the first steps return new frames, and
+    # later steps do not write into the arrays of the original table
+    t = remove_event_rows(table)
     t = drop_empty(t)
     t = fix_numerical_cols(t)
     t = fix_column_names(t)
@@ -259,6 +323,16 @@ def flatten_col_names(columns: pd.Index) -> List[str]:
 
 # --- POLL AGGREGATION ---
 
+@njit(cache=True, fastmath=True)
+def _ewm_kernel(values, decay, ewm):
+    """Single pass over the observations for calculate_ewm()."""
+    numerator, denominator = 0.0, 0.0
+    for i in range(values.size):
+        numerator = numerator * decay[i] + values[i]
+        denominator = denominator * decay[i] + 1.0
+        ewm[i] = numerator / denominator
+
+
 # Calculate an exponentially weighted average
 def calculate_ewm(series, times, halflife):
     """Calculate an exponentially weighted mean for a series."""
@@ -267,12 +341,40 @@ def calculate_ewm(series, times, halflife):
     assert len(series) == len(times)
     assert series.notna().all()
     assert times.notna().all()
-    
-    return (
-        series
-        .ewm(halflife=halflife, times=times)
-        .mean()
-    )
+    assert times.is_monotonic_increasing
+    if not isinstance(halflife, (str, datetime.timedelta, np.timedelta64)):
+        # as per pandas - a number is not a time-based halflife
+        raise ValueError("halflife must be a timedelta convertible object")
+
+    # without numba, pandas' compiled ewm() beats the loop in plain python
+    if not _HAVE_NUMBA:
+        return series.ewm(halflife=halflife, times=times).mean()
+
+    # The adjusted exponentially weighted mean (as per pandas'
+    # ewm(halflife=halflife, times=times).mean()), calculated
+    # in a single pass, with the weights of earlier observations
+    # decaying by 0.5 ** (elapsed time / halflife) at each step.
+    values = series.to_numpy(dtype=np.float64)
+    nanoseconds = times.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    decay = np.ones(len(values))
+    decay[1:] = 0.5 ** (np.diff(nanoseconds) / pd.Timedelta(halflife).value)
+
+    ewm = np.empty(len(values))
+    _ewm_kernel(values, decay, ewm)
+    return pd.Series(ewm, index=series.index, name=series.name)
+
+
+NANOSECONDS_PER_DAY = 24 * 60 * 60 * 1_000_000_000
+
+
+@functools.lru_cache(maxsize=256)
+def _lowess_fit(y: bytes, x: bytes, frac: float) -> np.ndarray:
+    """LOWESS fit, memoised on the raw bytes of the float64 y and x arrays."""
+    fit = sm.nonparametric.lowess(
+        endog=np.frombuffer(y), exog=np.frombuffer(x), # y, x ...
+        frac=frac, is_sorted=True, return_sorted=False)
+    fit.flags.writeable = False # shared by every cache hit
+    return fit
 
 
 # Calulcate a LOWESS regression
@@ -280,40 +382,46 @@ def calculate_lowess(series, times, period):
     # sanity checks
     assert len(series) == len(times)
 
-    day = (times - times.min()) / pd.Timedelta(days=1) + 1
+    # day number (from 1) for each observation, as a float64 array
+    nanoseconds = times.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    day = (nanoseconds - nanoseconds.min()) / NANOSECONDS_PER_DAY + 1.0
     frac = period / day.max()
     if frac < 0 or frac > 1:
         return None
-    
-    lowess = sm.nonparametric.lowess(
-        endog=series, exog=day, # y, x ...
-        frac=frac, is_sorted=True)
 
-    lowess = {int(x[0]): x[1] for x in lowess}
-    lowess = day.map(lowess).interpolate()
+    y = np.ascontiguousarray(series, dtype=np.float64)
+    # the fitted values are in the same order as the observations,
+    # with NaN for any missing observations - these take the fit for
+    # their day (from another poll on that day), and only days with 
+    # no fit at all are interpolated
+    lowess = pd.Series(_lowess_fit(y.tobytes(), day.tobytes(), frac))
+    lowess = lowess.fillna(lowess.groupby(day).transform('first'))
+    lowess = lowess.interpolate()
     lowess.index = times
-
     return lowess
 
 
 def calc_chi_squared(series, sample_sizes, percent=95, mean=None):
     
+    # work with plain numpy arrays (matched by position, not index)
+    s = np.asarray(series, dtype=np.float64)
+    n = np.asarray(sample_sizes, dtype=np.float64)
+
     # sanity checks
     assert percent >= 50 and percent <= 100 
-    assert all(series >= 0) and all(series <= 100)  # series is percentages
-    assert len(series) == len(sample_sizes)
-    assert len(series) >= 2 
+    assert ((s >= 0) & (s <= 100)).all()  # series is percentages
+    assert len(s) == len(n)
+    assert len(s) >= 2 
 
     # set up for calculation
-    deg_of_freedom = len(series) - 1
+    deg_of_freedom = len(s) - 1
     two_tail = ((100.0 - percent) / 100.0) / 2.0
     if mean is None:
-        mean = series.mean()
-    variances = (series * (100-series)) / sample_sizes
-    standard_deviations = pd.Series(np.sqrt(variances))
+        mean = s.mean()
+    variances = (s * (100-s)) / n
     
     # Key calculations
-    X = pow((series - mean)/standard_deviations, 2).sum()
+    X = np.nansum(np.square(s - mean) / variances)
     X_min = stats.distributions.chi2.ppf(two_tail, df=deg_of_freedom)
     X_max = stats.distributions.chi2.ppf(1 - two_tail, df=deg_of_freedom)
     
@@ -342,9 +450,28 @@ MARKERS = [
 ]
 
 
-def initiate_plot():
-    """Get a matplotlib figure and axes instance."""
-    fig, ax = plt.subplots(figsize=(9, 4.5), constrained_layout=False)
+# A figure (not managed by pyplot) for initiate_plot(reuse_fig=True)
+_reusable_plot = None
+
+
+def initiate_plot(reuse_fig=False):
+    """Get a matplotlib figure and axes instance.
+    With reuse_fig, the same figure is cleared and returned on each
+    call, which avoids the cost of building a new figure for every
+    chart. As pyplot does not manage this figure, it is only suitable
+    for charts that are saved to file, rather than shown."""
+    global _reusable_plot
+    if not reuse_fig:
+        fig, ax = plt.subplots(figsize=(9, 4.5), constrained_layout=False)
+    elif _reusable_plot is None:
+        fig = Figure(figsize=(9, 4.5), constrained_layout=False)
+        ax = fig.add_subplot()
+        _reusable_plot = fig, ax
+    else:
+        fig, ax = _reusable_plot
+        ax.clear()
+        for text in list(fig.texts): # footers from plot_finalise()
+            text.remove()
     ax.margins(0.02)
     return fig, ax
 
@@ -384,16 +511,61 @@ def add_data_points_by_pollster(ax, df, column, p_color,
                                 brand_col='Firm', 
                                 date_col='Mean Date', no_label=False, marker=None):
     """Add individual poll results to the plot."""
-    for i, brand in enumerate(sorted(df[brand_col].unique())):
-        poll = df[df[brand_col] == brand]
-        series = (
-            poll[column].sum(axis=1, skipna=True) if type(column) is list 
-            else poll[column]
-        )
-        label = None if no_label else brand
-        m = marker if marker is not None else MARKERS[i]
-        ax.scatter(poll[date_col], series, marker=m, 
-                   c=p_color, s=20, label=label)
+    x = df[date_col].to_numpy()
+    y = (
+        df[column].sum(axis=1, skipna=True) if type(column) is list 
+        else df[column]
+    ).to_numpy()
+
+    # a common marker and no labels - so no need to split by brand
+    if no_label and marker is not None:
+        ax.scatter(x, y, marker=marker, c=p_color, s=20)
+        return
+
+    codes, brands = pd.factorize(df[brand_col], sort=True)
+    markers = [marker if marker is not None else MARKERS[i] 
+               for i in range(len(brands))]
+
+    # without a colour, each brand takes the next colour 
+    # from the axes' colour cycle - so one scatter per brand
+    if p_color is None:
+        for i, brand in enumerate(brands):
+            selected = codes == i
+            label = None if no_label else brand
+            ax.scatter(x[selected], y[selected], marker=markers[i], 
+                       c=p_color, s=20, label=label)
+        return
+
+    # otherwise, draw every point in a single collection, 
+    # with each point using the marker path for its brand
+    paths = []
+    for m in markers:
+        style = MarkerStyle(m)
+        paths.append(style.get_path().transformed(style.get_transform()))
+    plotted = (codes >= 0) & pd.notna(y)
+    ax.xaxis.update_units(x)
+    points = PathCollection(
+        [paths[code] for code in codes[plotted]],
+        sizes=[20],
+        offsets=np.column_stack(
+            [ax.convert_xunits(x[plotted]), y[plotted].astype(float)]
+        ),
+        offset_transform=ax.transData,
+        facecolors=p_color,
+        edgecolors='face',
+        linewidths=plt.rcParams['patch.linewidth'], # as per ax.scatter()
+    )
+    points.set_transform(IdentityTransform())  # as per ax.scatter()
+    ax.add_collection(points)
+    ax.autoscale_view()
+
+    # empty lines stand in for the brands in the legend
+    if not no_label:
+        for m, brand in zip(markers, brands):
+            ax.plot([], [], marker=m, linestyle='', color=p_color,
+                    markersize=np.sqrt(20), # s=20 is an area
+                    markeredgewidth=plt.rcParams['patch.linewidth'],
+                    label=brand)
 
 
 def add_h_refence(ax, reference):
@@ -463,16 +635,18 @@ def plot_finalise(ax, title=None, xlabel=None, ylabel=None,
         pathlib.Path(location).mkdir(parents=True, exist_ok=True)
         ax.figure.savefig(f'{file_stem}.png', dpi=300)
     
-    # close
-    if close:
+    # close - the reusable figure is not known to pyplot
+    reused = _reusable_plot is not None and ax.figure is _reusable_plot[0]
+    if close and not reused:
         plt.show()
         plt.close()
     
     
 def plot_summary_line(df, column, p_color, l_color, title,
-                      function, argument, label, lfooter, rot=90):
+                      function, argument, label, lfooter, rot=90,
+                      reuse_fig=False):
     """Generate a summary line plot, where the line is generated by function()"""
-    fig, ax = initiate_plot()
+    fig, ax = initiate_plot(reuse_fig=reuse_fig)
     add_data_points_by_pollster(ax, df, column, p_color)
     add_summary_line(ax, df, column, l_color, function, argument, label, rot=rot)
     ax.legend(loc='best')
@@ -484,12 +658,13 @@ def plot_summary_line(df, column, p_color, l_color, title,
                      
                      
 def plot_summary_line_by_pollster(df, column, title,
-                                  function, argument, lfooter, rot=0):
+                                  function, argument, lfooter, rot=0,
+                                  reuse_fig=False):
     """For each pollster, plot a summary line calculated with function()"""
     MINIMUM_POLLS_REQUIRED = 2 # two polls needed for a line
-    fig, ax = initiate_plot()
-    for i, pollster in enumerate(sorted(df['Brand'].unique())):
-        polls = df[df['Brand'] == pollster].copy()
+    fig, ax = initiate_plot(reuse_fig=reuse_fig)
+    by_pollster = df.groupby('Brand', sort=True)
+    for i, (pollster, polls) in enumerate(by_pollster):
         if len(polls) < MINIMUM_POLLS_REQUIRED:
             continue
         add_summary_line(ax, df=polls, column=column, l_color=None, 